@@ -1,117 +1,322 @@
+import heapq
+import os
 import sys
+import threading
+import time
 import psutil
 import platform
 import subprocess
 import GPUtil
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QEvent, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QTabWidget, QTableWidget,
     QTableWidgetItem, QHeaderView, QPushButton, QMessageBox, QProgressBar,
     QLabel, QHBoxLayout
 )
-from PyQt6.QtGui import QColor, QFont, QPixmap, QKeySequence, QShortcut
-from typing import Dict, List, Union
+from PyQt6.QtGui import QBrush, QColor, QFont, QPixmap, QKeySequence, QShortcut
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional
 import glob
+from collections import deque
+
+_GB = 1 << 30
+_MB = 1 << 20
+
+@dataclass(slots=True)
+class Snapshot:
+    # One field per monitor section; only the sections collected this tick are set.
+    cpu: Optional[tuple] = None        # (model, (physical, logical), freq_hz, temp, load)
+    gpu: Optional[list] = None         # [(name, memory_used, memory_total, load, temp), ...]
+    memory: Optional[tuple] = None     # (total, used, percent)
+    disk: Optional[list] = None        # [(device, mount, total, used, percent), ...]
+    processes: Optional[list] = None   # [(pid, name, cpu_percent, rss), ...]
+    network: Optional[list] = None     # [(iface, addresses, is_up, bytes_sent, bytes_recv), ...]
+
+class SystemMonitor(QObject):
+    data_updated = pyqtSignal(object)
+    # Partitions and interface addresses rarely change; re-enumerate them every N ticks.
+    STATIC_REFRESH_TICKS = 10
+    # Load history keeps one sample per poll tick (~3.7 minutes at 3.5 s).
+    HISTORY_LEN = 64
 
-class SystemMonitor(QThread):
-    data_updated = pyqtSignal(dict)
-
-    def run(self):
-        while True:
+    def __init__(self):
+        super().__init__()
+        self._cpu_model = None
+        self._cores = None
+        self._temp_fd = self._open_temp_sensor()
+        self._page_size = os.sysconf('SC_PAGE_SIZE') if platform.system() == "Linux" else None
+        self._parts_cache = None
+        self._parts_age = 0
+        self._addrs_cache = None
+        self._addrs_age = 0
+        self._clk_tck = os.sysconf('SC_CLK_TCK') if self._page_size else None
+        self._proc_times = {}
+        self._proc_sample_time = None
+        # GPUtil shells out to nvidia-smi; skip it when there is no NVIDIA driver.
+        self._has_nvidia = os.path.exists('/proc/driver/nvidia/version') if platform.system() == "Linux" else True
+        self._gpu_seen = False
+        self._cpu_load = 0.0
+        self._mem = None
+        self._hist_lock = threading.Lock()
+        self._cpu_hist = deque(maxlen=self.HISTORY_LEN)
+        self._mem_hist = deque(maxlen=self.HISTORY_LEN)
+
+    def __del__(self):
+        self._close_temp_sensor()
+
+    @pyqtSlot()
+    def prime(self):
+        # Runs on the worker thread once it starts. CPU % is measured between two
+        # samples (cached psutil.Process objects, or the previous /proc stat
+        # ticks), so take a baseline here to make the first process tick meaningful.
+        self._collect_processes()
+        psutil.cpu_percent()
+
+    @pyqtSlot(str, bool)
+    def collect(self, section: str, tick: bool):
+        # tick is set only by the poll timer, so load history gets exactly one
+        # sample per tick whatever tab is shown; section is empty when no tab
+        # needs data.
+        try:
+            if tick:
+                self._sample_load()
+            if section:
+                snapshot = Snapshot(**{section: getattr(self, f"_collect_{section}")()})
+                self.data_updated.emit(snapshot)
+        except Exception as e:
+            print(f"Monitoring error: {e}")
+
+    def close(self):
+        self._close_temp_sensor()
+
+    def history(self, section: str) -> tuple:
+        # Recent load samples in percent, oldest first, for 'cpu' or 'memory'.
+        # Called from the GUI thread while the worker appends, hence the lock.
+        with self._hist_lock:
+            return tuple({'cpu': self._cpu_hist, 'memory': self._mem_hist}[section])
+
+    def _sample_load(self):
+        self._cpu_load = psutil.cpu_percent()
+        self._mem = self._read_memory()
+        with self._hist_lock:
+            self._cpu_hist.append(self._cpu_load)
+            self._mem_hist.append(self._mem[2])
+
+    def _open_temp_sensor(self):
+        if platform.system() != "Linux":
+            return None
+        for path in sorted(glob.glob("/sys/class/thermal/thermal_zone*/temp")):
             try:
-                data = {
-                    'cpu': self._get_cpu_data(),
-                    'gpu': self._get_gpu_data(),
-                    'memory': self._get_memory_data(),
-                    'disk': self._get_disk_data(),
-                    'processes': self._get_process_data(),
-                    'network': self._get_network_data()
-                }
-                self.data_updated.emit(data)
-                self.msleep(3500)
-            except Exception as e:
-                print(f"Monitoring error: {e}")
+                return os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+        return None
+
+    def _close_temp_sensor(self):
+        fd, self._temp_fd = getattr(self, '_temp_fd', None), None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
 
-    def _get_cpu_data(self) -> Dict[str, Union[str, float]]:
+    def _collect_cpu(self) -> tuple:
         freq = psutil.cpu_freq()
-        return {
-            "Model": self._get_cpu_model(),
-            "Cores": f"{psutil.cpu_count(logical=False)}/{psutil.cpu_count(logical=True)}",
-            "Frequency": f"{freq.current/1000:.1f} GHz" if freq else "N/A",
-            "Temperature": self._get_cpu_temp(),
-            "Load": psutil.cpu_percent()
-        }
+        if self._cores is None:
+            self._cores = (psutil.cpu_count(logical=False), psutil.cpu_count(logical=True))
+        # cpu_percent() measures since its previous call, so reuse the tick's sample.
+        return (
+            self._get_cpu_model(),
+            self._cores,
+            int(freq.current * 1e6) if freq else None,
+            self._get_cpu_temp(),
+            self._cpu_load
+        )
 
     def _get_cpu_model(self) -> str:
+        if self._cpu_model is None:
+            self._cpu_model = self._read_cpu_model()
+        return self._cpu_model
+
+    def _read_cpu_model(self) -> str:
         try:
             if platform.system() == "Linux":
-                for f in glob.glob("/proc/cpuinfo"):
-                    with open(f, 'r') as cpuinfo:
-                        for line in cpuinfo:
-                            if line.strip().startswith('model name'):
-                                return line.split(':')[1].strip().replace('(R)', '').replace('(TM)', '')
+                with open("/proc/cpuinfo", 'r') as cpuinfo:
+                    for line in cpuinfo:
+                        if line.strip().startswith('model name'):
+                            return line.split(':')[1].strip().replace('(R)', '').replace('(TM)', '')
             return platform.processor()
         except Exception:
             return "Unknown"
 
-    def _get_cpu_temp(self) -> str:
+    def _get_cpu_temp(self) -> Optional[float]:
+        if self._temp_fd is None:
+            return None
         try:
-            if platform.system() == "Linux":
-                for f in glob.glob("/sys/class/thermal/thermal_zone*/temp"):
-                    with open(f) as tfile:
-                        return f"{int(tfile.read().strip())/1000:.1f}°C"
-        except:
-            return "N/A"
-
-    def _get_gpu_data(self) -> List[Dict]:
-        return [{
-            'name': gpu.name,
-            'memory': f"{gpu.memoryUsed:.1f}/{gpu.memoryTotal:.0f} GB",
-            'load': gpu.load*100,
-            'temp': gpu.temperature
-        } for gpu in GPUtil.getGPUs()]
-
-    def _get_memory_data(self) -> Dict:
+            return int(os.pread(self._temp_fd, 16, 0).strip()) / 1000
+        except (OSError, ValueError):
+            return None
+
+    def _collect_gpu(self) -> List[tuple]:
+        if not self._has_nvidia:
+            return []
+        gpus = [
+            (gpu.name, gpu.memoryUsed, gpu.memoryTotal, gpu.load*100, gpu.temperature)
+            for gpu in GPUtil.getGPUs()
+        ]
+        if gpus:
+            self._gpu_seen = True
+        elif not self._gpu_seen:
+            # getGPUs() also returns [] when nvidia-smi fails, so only give up
+            # if no GPU has ever been reported.
+            self._has_nvidia = False
+        return gpus
+
+    def _collect_memory(self) -> tuple:
+        return self._mem if self._mem is not None else self._read_memory()
+
+    def _read_memory(self) -> tuple:
+        if platform.system() == "Linux":
+            try:
+                return self._read_meminfo()
+            except (OSError, ValueError):
+                pass
         mem = psutil.virtual_memory()
-        return {'total': mem.total, 'used': mem.used, 'percent': mem.percent}
-
-    def _get_disk_data(self) -> List[Dict]:
-        return [{
-            'device': part.device.split('/')[-1],
-            'mount': part.mountpoint,
-            'total': (du := psutil.disk_usage(part.mountpoint)).total,
-            'used': du.used,
-            'percent': du.percent
-        } for part in psutil.disk_partitions() if part.mountpoint]
-
-    def _get_process_data(self):
-        return sorted([
-            (p.info['pid'], p.info['name'], p.info['cpu_percent'], p.info['memory_info'].rss)
-            for p in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info'])
-            if p.info['name']
-        ], key=lambda x: x[2], reverse=True)[:100]
-
-    def _get_network_data(self) -> Dict:
-        net = psutil.net_io_counters()
-        addrs = psutil.net_if_addrs()
-        stats = psutil.net_if_stats()
-        return {
-            'interfaces': {
-                iface: {
-                    'addresses': [addr.address for addr in addrs[iface]],
-                    'stats': {
-                        'bytes_sent': net.bytes_sent,
-                        'bytes_recv': net.bytes_recv,
-                        'is_up': stats[iface].isup if iface in stats else False
-                    }
-                } for iface in addrs
+        return mem.total, mem.used, mem.percent
+
+    def _read_meminfo(self) -> tuple:
+        with open("/proc/meminfo", 'rb') as meminfo:
+            data = meminfo.read(512)
+        total = self._meminfo_field(data, b'MemTotal:')
+        used = total - self._meminfo_field(data, b'MemAvailable:')
+        return total, used, used * 100 / total
+
+    @staticmethod
+    def _meminfo_field(data: bytes, key: bytes) -> int:
+        start = data.find(key)
+        if start < 0:
+            raise ValueError(f"{key.decode()} not found in /proc/meminfo")
+        start += len(key)
+        return int(data[start:data.index(b'kB', start)]) * 1024
+
+    def _collect_disk(self) -> List[tuple]:
+        disks = []
+        for part in self._get_partitions():
+            try:
+                du = psutil.disk_usage(part.mountpoint)
+            except OSError:
+                # Unmounted since the partition list was cached; re-enumerate next tick.
+                self._parts_cache = None
+                continue
+            disks.append((part.device.split('/')[-1], part.mountpoint, du.total, du.used, du.percent))
+        return disks
+
+    def _get_partitions(self):
+        if self._parts_cache is None or self._parts_age >= self.STATIC_REFRESH_TICKS:
+            self._parts_cache = [part for part in psutil.disk_partitions() if part.mountpoint]
+            self._parts_age = 0
+        self._parts_age += 1
+        return self._parts_cache
+
+    def _get_if_addrs(self):
+        if self._addrs_cache is None or self._addrs_age >= self.STATIC_REFRESH_TICKS:
+            self._addrs_cache = {
+                iface: tuple(addr.address for addr in addrs)
+                for iface, addrs in psutil.net_if_addrs().items()
             }
-        }
+            self._addrs_age = 0
+        self._addrs_age += 1
+        return self._addrs_cache
+
+    def _collect_processes(self):
+        if self._page_size is None:
+            return heapq.nlargest(100, (
+                (p.info['pid'], p.info['name'], p.info['cpu_percent'], p.info['memory_info'].rss)
+                for p in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info'])
+                if p.info['name']
+            ), key=lambda x: x[2])
+
+        now = time.monotonic()
+        prev_times = self._proc_times
+        elapsed = (now - self._proc_sample_time) * self._clk_tck if self._proc_sample_time else 0
+        times = {}
+        top = heapq.nlargest(100, self._iter_proc_stats(prev_times, times, elapsed), key=lambda x: x[2])
+        self._proc_times = times
+        self._proc_sample_time = now
+        return top
+
+    def _iter_proc_stats(self, prev_times: Dict[tuple, int], times: Dict[tuple, int], elapsed: float):
+        read_stat = self._read_proc_stat
+        for pid in self._iter_pids():
+            try:
+                name, ticks, rss, starttime = read_stat(pid)
+            except (OSError, IndexError, ValueError):
+                continue
+            # Key on (pid, starttime) so a reused PID counts as a new process.
+            key = (pid, starttime)
+            times[key] = ticks
+            prev = prev_times.get(key)
+            cpu = max(ticks - prev, 0) * 100 / elapsed if elapsed and prev is not None else 0.0
+            if name:
+                yield pid, name, cpu, rss
+
+    @staticmethod
+    def _iter_pids():
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if entry.name.isdigit():
+                    yield int(entry.name)
+
+    def _read_proc_stat(self, pid: int):
+        with open(f"/proc/{pid}/stat", 'rb') as stat:
+            data = stat.read()
+        # The name is wrapped in parentheses and may itself contain spaces or ')'.
+        lpar = data.index(b'(')
+        rpar = data.rindex(b')')
+        stat_fields = data[rpar + 2:].split()
+        # stat_fields[0] is field 3 (state): utime=14, stime=15, starttime=22, rss=24.
+        return (
+            data[lpar + 1:rpar].decode(errors='replace'),
+            int(stat_fields[11]) + int(stat_fields[12]),
+            int(stat_fields[21]) * self._page_size,
+            int(stat_fields[19])
+        )
+
+    def _collect_network(self) -> List[tuple]:
+        net = psutil.net_io_counters(pernic=True)
+        stats = psutil.net_if_stats()
+        interfaces = []
+        for iface, addresses in self._get_if_addrs().items():
+            counters = net.get(iface)
+            st = stats.get(iface)
+            interfaces.append((
+                iface,
+                addresses,
+                st.isup if st else False,
+                counters.bytes_sent if counters else 0,
+                counters.bytes_recv if counters else 0
+            ))
+        return interfaces
 
 class SystemDashboard(QWidget):
+    collect_requested = pyqtSignal(str, bool)
+    POLL_INTERVAL_MS = 3500
+    # Monitor section collected for each tab, in tab order; None means nothing to poll.
+    TAB_SECTIONS = ['cpu', 'gpu', 'memory', 'disk', 'processes', 'network', None]
+    _DISK_TMPL = "{v:.1f}G"
+    _NET_TMPL = "{v:.1f} MB"
+
     def __init__(self):
         super().__init__()
         self.pinned_pid = None
+        self._silenced = False
+        self._prev_disk = {}
+        self._prev_net = {}
+        self._fmt_scratch = {}
+        self._last_data = {}
+        self._pid_rows = {}
+        self._last_highlight_row = None
+        self._pinned_proc = None
         self.setWindowTitle("System Monitor Pro")
         self.setFixedSize(750, 600)  # Увеличил размер для новой вкладки
         self.init_ui()
@@ -140,23 +345,39 @@ class SystemDashboard(QWidget):
         self.shortcut_kill_pinned = QShortcut(QKeySequence("Ctrl+Z"), self)
         self.shortcut_kill_pinned.activated.connect(self._kill_pinned_process)
 
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str,
+                      buttons=QMessageBox.StandardButton.Ok) -> QMessageBox:
+        # open() is non-blocking, so the poll timer keeps running behind the dialog.
+        box = QMessageBox(icon, title, text, buttons, self)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.open()
+        return box
+
     def _kill_pinned_process(self):
         if self.pinned_pid:
-            confirm = QMessageBox.question(
-                self, "Confirm Termination",
-                f"Terminate process PID {self.pinned_pid}?",
+            pid = self.pinned_pid
+            box = self._show_message(
+                QMessageBox.Icon.Question, "Confirm Termination",
+                f"Terminate process PID {pid}?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
-            if confirm == QMessageBox.StandardButton.Yes:
-                try:
-                    psutil.Process(self.pinned_pid).terminate()
-                    self.pinned_pid = None
-                    self._highlight_pinned_process()
-                    QMessageBox.information(self, "Success", "Pinned process terminated")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Error: {str(e)}")
+            box.buttonClicked.connect(
+                lambda button: self._terminate_pinned_process(pid, box.standardButton(button))
+            )
         else:
-            QMessageBox.warning(self, "Warning", "No pinned process selected")
+            self._show_message(QMessageBox.Icon.Warning, "Warning", "No pinned process selected")
+
+    def _terminate_pinned_process(self, pid: int, answer: QMessageBox.StandardButton):
+        if answer != QMessageBox.StandardButton.Yes:
+            return
+        try:
+            psutil.Process(pid).terminate()
+            if self.pinned_pid == pid:
+                self.pinned_pid = None
+                self._highlight_pinned_process()
+            self._show_message(QMessageBox.Icon.Information, "Success", "Pinned process terminated")
+        except Exception as e:
+            self._show_message(QMessageBox.Icon.Critical, "Error", f"Error: {str(e)}")
 
     def _create_help_tab(self):
         help_text = """
@@ -318,124 +539,218 @@ class SystemDashboard(QWidget):
         """)
 
     def start_monitoring(self):
+        # Collection runs on a worker thread; the timer here only asks for it.
+        self.monitor_thread = QThread(self)
         self.monitor = SystemMonitor()
+        self.monitor.moveToThread(self.monitor_thread)
+        self.monitor_thread.started.connect(self.monitor.prime)
+        self.collect_requested.connect(self.monitor.collect, Qt.ConnectionType.QueuedConnection)
         self.monitor.data_updated.connect(self._update_ui)
-        self.monitor.start()
-
-    def _update_ui(self, data):
-        self._update_cpu(data['cpu'])
-        self._update_gpu(data['gpu'])
-        self._update_memory(data['memory'])
-        self._update_disk(data['disk'])
-        self._update_processes(data['processes'])
-        self._update_network(data['network'])
+        self.monitor_thread.start()
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self.poll_timer.timeout.connect(lambda: self._poll(tick=True))
+        self.poll_timer.start()
+        self.tabs.currentChanged.connect(lambda _: self._poll())
+        QTimer.singleShot(0, lambda: self._poll(tick=True))
+
+    def _poll(self, tick: bool = False):
+        section = None
+        if not self._silenced and self.isVisible():
+            section = self.TAB_SECTIONS[self.tabs.currentIndex()]
+        if section or tick:
+            self.collect_requested.emit(section or "", tick)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._silenced = self.isMinimized()
+            if not self._silenced:
+                self._poll()
+        super().changeEvent(event)
+
+    def closeEvent(self, event):
+        self.poll_timer.stop()
+        self.monitor_thread.quit()
+        self.monitor_thread.wait()
+        self.monitor.close()
+        super().closeEvent(event)
+
+    def _update_ui(self, snapshot: Snapshot):
+        # Qt already coalesces the per-item repaints below into one paint per
+        # event-loop pass, so only off-screen and unchanged sections need skipping.
+        current = self.TAB_SECTIONS[self.tabs.currentIndex()]
+        for field in fields(snapshot):
+            section = field.name
+            data = getattr(snapshot, section)
+            # Skip off-screen tabs, sections not collected this tick and
+            # sections identical to the last update.
+            if section != current or data is None or self._last_data.get(section) == data:
+                continue
+            self._last_data[section] = data
+            getattr(self, f"_update_{section}")(data)
 
     def _update_table(self, table: QTableWidget, data: List[List]):
-        table.setRowCount(len(data))
-        for row, items in enumerate(data):
-            for col, item in enumerate(items):
-                table.setItem(row, col, QTableWidgetItem(str(item)))
+        # Only a row-count change touches the whole table; otherwise let Qt
+        # repaint just the cells whose text changed.
+        resize = table.rowCount() != len(data)
+        if resize:
+            table.setUpdatesEnabled(False)
+            table.setRowCount(len(data))
+        try:
+            for row, items in enumerate(data):
+                for col, value in enumerate(items):
+                    text = str(value)
+                    item = table.item(row, col)
+                    if item is None:
+                        table.setItem(row, col, QTableWidgetItem(text))
+                    elif item.text() != text:
+                        item.setText(text)
+        finally:
+            if resize:
+                table.setUpdatesEnabled(True)
 
     def _update_cpu(self, data):
-        self.cpu_meter.setValue(int(data['Load']))
+        model, cores, freq, temp, load = data
+        self.cpu_meter.setValue(int(load))
         self._update_table(self.cpu_table, [
-            ["Model", data['Model']],
-            ["Cores/Threads", data['Cores']],
-            ["Frequency", data['Frequency']],
-            ["Temperature", data['Temperature']]
+            ["Model", model],
+            ["Cores/Threads", "{}/{}".format(*cores)],
+            ["Frequency", f"{freq/1e9:.1f} GHz" if freq else "N/A"],
+            ["Temperature", f"{temp:.1f}°C" if temp is not None else "N/A"],
+            self._average_row("Average load", self.monitor.history('cpu'))
         ])
 
+    @staticmethod
+    def _average_row(label: str, samples: tuple) -> List[str]:
+        if not samples:
+            return [label, "N/A"]
+        return [f"{label} (last {len(samples)} samples)", f"{sum(samples) / len(samples):.1f}%"]
+
     def _update_gpu(self, data):
         if data:
-            self.gpu_meter.setValue(int(data[0]['load']))
+            self.gpu_meter.setValue(int(data[0][3]))
             gpu_info = [[
-                g['name'],
-                g['memory'],
-                f"{g['load']:.0f}%",
-                f"{g['temp']}°C"
-            ] for g in data]
+                name,
+                f"{mem_used:.1f}/{mem_total:.0f} GB",
+                f"{load:.0f}%",
+                f"{temp}°C"
+            ] for name, mem_used, mem_total, load, temp in data]
             self._update_table(self.gpu_table, gpu_info)
         else:
             self.gpu_meter.setValue(0)
             self._update_table(self.gpu_table, [["No GPU detected", "", "", ""]])
 
     def _update_memory(self, data):
-        self.mem_meter.setValue(int(data['percent']))
+        total, used, percent = data
+        self.mem_meter.setValue(int(percent))
         self._update_table(self.mem_table, [[
-            f"{data['total']/(1024**3):.1f} GB",
-            f"{data['used']/(1024**3):.1f} GB",
-            f"{(data['total']-data['used'])/(1024**3):.1f} GB"
+            f"{total/_GB:.1f} GB",
+            f"{used/_GB:.1f} GB",
+            f"{(total-used)/_GB:.1f} GB"
         ]])
 
+    def _format_size(self, prev_cache: Dict, cache: Dict, key, value: int, unit: int, template: str) -> str:
+        # Reuse the previous string until the value drifts by at least 1 MB.
+        # Entries are carried from prev_cache into cache, so keys for mounts or
+        # interfaces that disappeared are dropped on the next update.
+        prev = prev_cache.get(key)
+        if prev is not None and abs(value - prev[0]) < _MB:
+            cache[key] = prev
+            return prev[1]
+        scratch = self._fmt_scratch
+        scratch['v'] = value / unit
+        text = template.format_map(scratch)
+        cache[key] = (value, text)
+        return text
+
     def _update_disk(self, data):
+        prev, cache = self._prev_disk, {}
         disk_info = [[
-            d['device'],
-            d['mount'],
-            f"{d['total']/(1024**3):.1f}G",
-            f"{d['used']/(1024**3):.1f}G",
-            f"{(d['total']-d['used'])/(1024**3):.1f}G",
-            f"{d['percent']}%"
-        ] for d in data]
+            device,
+            mount,
+            self._format_size(prev, cache, (mount, 'total'), total, _GB, self._DISK_TMPL),
+            self._format_size(prev, cache, (mount, 'used'), used, _GB, self._DISK_TMPL),
+            self._format_size(prev, cache, (mount, 'free'), total - used, _GB, self._DISK_TMPL),
+            f"{percent}%"
+        ] for device, mount, total, used, percent in data]
+        self._prev_disk = cache
         self._update_table(self.disk_table, disk_info)
 
     def _update_processes(self, processes):
         if self.pinned_pid:
             try:
-                p = psutil.Process(self.pinned_pid)
-                pinned_proc = (p.pid, p.name(), p.cpu_percent(), p.memory_info().rss)
+                if self._pinned_proc is None or self._pinned_proc.pid != self.pinned_pid:
+                    self._pinned_proc = psutil.Process(self.pinned_pid)
+                    self._pinned_proc.cpu_percent(None)
+                p = self._pinned_proc
+                pinned_proc = (p.pid, p.name(), p.cpu_percent(None), p.memory_info().rss)
                 processes = [pinned_proc] + [proc for proc in processes if proc[0] != self.pinned_pid]
             except:
                 self.pinned_pid = None
 
+        # Sort by PID (pinned process first) so rows stay put between ticks.
+        processes = sorted(processes[:100], key=lambda p: (p[0] != self.pinned_pid, p[0]))
         display = [[
             p[0],
             p[1],
             f"{p[2]:.1f}%",
-            f"{p[3]/1024**2:.1f} MB"
-        ] for p in processes[:100]]
+            f"{p[3]/_MB:.1f} MB"
+        ] for p in processes]
 
         self._update_table(self.process_table, display)
+        self._pid_rows = {}
+        for row, p in enumerate(processes):
+            self._pid_rows[p[0]] = row
+            item = self.process_table.item(row, 0)
+            if item.data(Qt.ItemDataRole.UserRole) != p[0]:
+                item.setData(Qt.ItemDataRole.UserRole, p[0])
         self._highlight_pinned_process()
 
     def _update_network(self, data):
+        prev, cache = self._prev_net, {}
         network_info = []
-        for iface, info in data['interfaces'].items():
-            status = "Up" if info['stats']['is_up'] else "Down"
+        for iface, addresses, is_up, sent, recv in data:
             network_info.append([
                 iface,
-                ", ".join(info['addresses']),
-                status,
-                f"{info['stats']['bytes_sent']/1024**2:.1f} MB",
-                f"{info['stats']['bytes_recv']/1024**2:.1f} MB"
+                ", ".join(addresses),
+                "Up" if is_up else "Down",
+                self._format_size(prev, cache, (iface, 'sent'), sent, _MB, self._NET_TMPL),
+                self._format_size(prev, cache, (iface, 'recv'), recv, _MB, self._NET_TMPL)
             ])
+        self._prev_net = cache
         self._update_table(self.network_table, network_info)
 
     def _highlight_pinned_process(self):
-        highlight_color = QColor('#404040')
-        default_color = QColor('#121212')
-        
-        for row in range(self.process_table.rowCount()):
-            item = self.process_table.item(row, 0)
-            if item and self.pinned_pid and int(item.text()) == self.pinned_pid:
-                for col in range(self.process_table.columnCount()):
-                    self.process_table.item(row, col).setBackground(highlight_color)
-            else:
-                for col in range(self.process_table.columnCount()):
-                    self.process_table.item(row, col).setBackground(default_color)
+        if self.pinned_pid is None and self._last_highlight_row is None:
+            return
+        row = self._pid_rows.get(self.pinned_pid)
+        if row == self._last_highlight_row:
+            return
+        if self._last_highlight_row is not None:
+            self._paint_process_row(self._last_highlight_row, QBrush())
+        if row is not None:
+            self._paint_process_row(row, QBrush(QColor('#404040')))
+        self._last_highlight_row = row
+
+    def _paint_process_row(self, row: int, brush: QBrush):
+        for col in range(self.process_table.columnCount()):
+            if item := self.process_table.item(row, col):
+                item.setBackground(brush)
 
     def _toggle_pinned_process(self, row, _):
-        pid = int(self.process_table.item(row, 0).text())
+        pid = self.process_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
         self.pinned_pid = pid if self.pinned_pid != pid else None
+        self._last_data.pop('processes', None)
         self._highlight_pinned_process()
 
     def _kill_process(self):
         if (row := self.process_table.currentRow()) >= 0:
             try:
-                pid = int(self.process_table.item(row, 0).text())
+                pid = self.process_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
                 psutil.Process(pid).terminate()
-                QMessageBox.information(self, "Успешно", f"Процесс {pid} завершен")
+                self._show_message(QMessageBox.Icon.Information, "Успешно", f"Процесс {pid} завершен")
             except Exception as e:
-                QMessageBox.critical(self, "Ошибка", f"Ошибка: {str(e)}")
+                self._show_message(QMessageBox.Icon.Critical, "Ошибка", f"Ошибка: {str(e)}")
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)